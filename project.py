@@ -1,14 +1,25 @@
-from enum import Enum
+from __future__ import annotations
+from array import array
+from enum import IntEnum
+from math import isfinite, isnan, nan
+from operator import itemgetter
+from typing import TYPE_CHECKING
 import csv
-import numpy as np
-import pyinputplus as pyip
-from sklearn.linear_model import LinearRegression
-from tabulate import tabulate
+import heapq
+import mmap
+import os
+import sys
 
-class Subject(Enum):
+if TYPE_CHECKING:
+    import numpy as np
+
+class Subject(IntEnum):
     """
     Enumeration of school subjects.
 
+    Members are integers, so they hash and compare like ints, and ``subject - 1`` is the subject's
+    row in the per-school result table.
+
     Attributes:
         POLISH (int): The Polish language subject.
         ENGLISH (int): The English language subject.
@@ -18,15 +29,31 @@ class Subject(Enum):
     ENGLISH = 2
     MATH = 3
 
+_SUBJECT_COLUMNS: tuple[tuple[str, Subject], ...] = (
+    ("polish_average", Subject.POLISH),
+    ("english_average", Subject.ENGLISH),
+    ("math_average", Subject.MATH)
+)
+
+_YEARS: tuple[int, ...] = (2021, 2022, 2023, 2024, 2025)
+_YEAR_CENTER: float = sum(_YEARS) / len(_YEARS)
+_YEAR_OFFSETS: tuple[float, ...] = tuple(year - _YEAR_CENTER for year in _YEARS)
+
 class School:
     """
     Represents a school with exam results for Polish, English, and Math subjects.
 
-    Each subject result is stored as a dictionary mapping the year to the average score.
+    Results are stored as a subjects × years table of floats, with one row per subject and one column
+    per entry of ``YEARS``; NaN marks a year without a result.
     Provides methods to add results, calculate averages, estimate performance trends,
-Spli    and convert school data into a dictionary format for further use (e.g., reporting or serialisation).
+    and convert school data into a dictionary format for further use (e.g., reporting or serialisation).
     """
 
+    __slots__ = ("name", "_arr", "_sum", "_count", "_fit_cache", "_dict_cache")
+
+    YEARS: tuple[int, ...] = _YEARS
+    YEAR_INDEX: dict[int, int] = {year: index for index, year in enumerate(YEARS)}
+
     def __init__(self, name) -> None:
         """
         Initialises a School instance with an empty result structure for each subject.
@@ -35,11 +62,11 @@ Spli    and convert school data into a dictionary format for further use (e.g.,
         :type name: str
         """
         self.name = name
-        self.results: dict[Subject, dict[int, float]] = {
-            Subject.POLISH: {},
-            Subject.ENGLISH: {},
-            Subject.MATH: {}
-        }
+        self._arr: array[float] = array("d", [nan]) * (len(Subject) * len(self.YEARS))
+        self._sum: list[float] = [0.0] * len(Subject)
+        self._count: list[int] = [0] * len(Subject)
+        self._fit_cache: list[tuple[float, float] | None] = [None] * len(Subject)
+        self._dict_cache: dict[int, dict[str, float]] = {}
 
     def has_results(self, subject: Subject) -> bool:
         """
@@ -50,20 +77,39 @@ Spli    and convert school data into a dictionary format for further use (e.g.,
         :return: True if results are present, False otherwise.
         :rtype: bool
         """
-        return len(self.results[subject].values()) > 0
+        return self._count[subject - 1] > 0
 
     def add_result(self, subject: Subject, year: int, result: float) -> None:
         """
         Adds an exam result for a specific subject and year.
 
+        A previous result for the same subject and year is replaced.
+
         :param subject: The subject for which to add the result.
         :type subject: Subject
         :param year: The year of the exam.
         :type year: int
         :param result: The average score for the exam.
         :type result: float
+
+        :raises KeyError: If the subject is not a `Subject` value or the year is not one of ``YEARS``.
+        :raises ValueError: If the result is NaN or infinite.
         """
-        self.results[subject][year] = result
+        index = subject - 1
+        if not 0 <= index < len(self._count):
+            raise KeyError(subject)
+        if not isfinite(result):
+            raise ValueError("result must be finite")
+        cell = index * len(self.YEARS) + self.YEAR_INDEX[year]
+        previous = self._arr[cell]
+        if isnan(previous):
+            self._count[index] += 1
+            self._sum[index] += result
+        else:
+            self._sum[index] += result - previous
+        self._arr[cell] = result
+        self._fit_cache[index] = None
+        self._dict_cache.clear()
 
     def calculate_average(self, subject: Subject) -> float:
         """
@@ -74,33 +120,61 @@ Spli    and convert school data into a dictionary format for further use (e.g.,
         :return: The average score, or 0.0 if no results are available.
         :rtype: float
         """
-        return sum(self.results[subject].values()) / len(self.results[subject]) if self.has_results(subject) else 0.0
+        index = subject - 1
+        count = self._count[index]
+        return self._sum[index] / count if count else 0.0
 
     def calculate_trend(self, subject: Subject, year: int) -> float:
         """
         Predicts the expected result for a given year using linear regression based on past results.
 
+        With a single result the slope is undefined, so that result is returned as the prediction.
+
         :param subject: The subject to calculate the trend for.
         :type subject: Subject
         :param year: The year for which to predict the result.
         :type year: int
         :return: The predicted score, clipped to the range 0.0–100.0. Returns 0.0 if no data is available.
         :rtype: float
-
-        :requires: `numpy` and `sklearn.linear_model.LinearRegression`
         """
-        if not self.has_results(subject):
-            return 0.0
-
-        x = np.array(list(self.results[subject].keys())).reshape(-1, 1)
-        y = np.array(list(self.results[subject].values()))
-
-        model = LinearRegression()
-        model.fit(x, y)
+        index = subject - 1
+        line = self._fit_cache[index]
+        if line is None:
+            line = self._fit_cache[index] = self._fit_line(subject)
+        slope, intercept = line
+        return max(0.0, min(100.0, slope * (year - _YEAR_CENTER) + intercept))
+
+    def _fit_line(self, subject: Subject) -> tuple[float, float]:
+        """
+        Fits the least-squares line through the results of a subject, bypassing the cache.
 
-        y_pred = model.predict(np.array([[year]]))
+        Subjects with fewer than two results get a flat line at the single result, or at 0.0 if there
+        is none.
 
-        return np.clip(y_pred[0], 0.0, 100.0)
+        :param subject: The subject to fit the line for.
+        :type subject: Subject
+        :return: The slope of the line and its value at ``_YEAR_CENTER``, the middle of the year grid.
+        :rtype: tuple[float, float]
+        """
+        n = 0
+        sum_x = sum_y = sum_xx = sum_xy = 0.0
+        start = (subject - 1) * len(self.YEARS)
+        for x, y in zip(_YEAR_OFFSETS, self._arr[start:start + len(self.YEARS)]):
+            if not isnan(y):
+                n += 1
+                sum_x += x
+                sum_y += y
+                sum_xx += x * x
+                sum_xy += x * y
+
+        if n == 0:
+            return 0.0, 0.0
+        if n == 1:
+            return 0.0, sum_y
+
+        slope = (n * sum_xy - sum_x * sum_y) / (n * sum_xx - sum_x * sum_x)
+        intercept = (sum_y - slope * sum_x) / n
+        return slope, intercept
 
     def convert_to_dict(self, trend_year: int) -> dict[str, float]:
         """
@@ -110,6 +184,8 @@ Spli    and convert school data into a dictionary format for further use (e.g.,
         This method is typically used for reporting, exporting, or feeding structured
         school performance data into downstream systems like analytics dashboards.
 
+        Each call returns a fresh dictionary, so callers may modify it freely.
+
         :param trend_year: The year for which to predict exam trends using linear regression.
         :type trend_year: int
         :return: A dictionary containing exam averages and trend predictions.
@@ -147,13 +223,22 @@ Spli    and convert school data into a dictionary format for further use (e.g.,
             "all_trend": 68.13
         }
         """
-        polish_average = self.calculate_average(Subject.POLISH)
-        polish_trend = self.calculate_trend(Subject.POLISH, trend_year)
-        english_average = self.calculate_average(Subject.ENGLISH)
-        english_trend = self.calculate_trend(Subject.ENGLISH, trend_year)
-        math_average = self.calculate_average(Subject.MATH)
-        math_trend = self.calculate_trend(Subject.MATH, trend_year)
-        return {
+        cached = self._dict_cache.get(trend_year)
+        if cached is not None:
+            return dict(cached)
+
+        fit_cache = self._fit_cache
+        if None in fit_cache:
+            for index, subject in enumerate(Subject):
+                if fit_cache[index] is None:
+                    fit_cache[index] = self._fit_line(subject)
+        offset = trend_year - _YEAR_CENTER
+        averages = [total / count if count else 0.0 for total, count in zip(self._sum, self._count)]
+        trends = [max(0.0, min(100.0, slope * offset + intercept)) for slope, intercept in fit_cache]
+
+        polish_average, english_average, math_average = averages
+        polish_trend, english_trend, math_trend = trends
+        school_dict = {
             "school": self.name,
             "polish_average": polish_average,
             "polish_trend": polish_trend,
@@ -161,9 +246,11 @@ Spli    and convert school data into a dictionary format for further use (e.g.,
             "english_trend": english_trend,
             "math_average": math_average,
             "math_trend": math_trend,
-            "all_average": (polish_average + english_average + math_average) / 3,
-            "all_trend": (polish_trend + english_trend + math_trend) / 3
+            "all_average": sum(averages) / len(averages),
+            "all_trend": sum(trends) / len(trends)
         }
+        self._dict_cache[trend_year] = school_dict
+        return dict(school_dict)
 
 def read_schools(years: list[str], city: str) -> list[School]:
     """
@@ -182,6 +269,7 @@ def read_schools(years: list[str], city: str) -> list[School]:
     :rtype: list[School]
 
     :raises FileNotFoundError: If any of the CSV files for the given years are missing.
+    :raises KeyError: If a year is not one of ``School.YEARS``.
     :raises KeyError: If expected CSV columns are missing (e.g., 'school', 'city', 'polish_average', etc.).
     :raises ValueError: If any non-numeric average values cannot be converted to float.
 
@@ -192,28 +280,82 @@ def read_schools(years: list[str], city: str) -> list[School]:
     15
     >>> schools[0].name
     'Publiczna SP nr 1 im. Jana Pawła II'
-    >>> schools[0].results[Subject.POLISH][2021]
+    >>> schools[0].calculate_average(Subject.POLISH)
     64.3
     """
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=max(1, len(years))) as executor:
+        years_rows = list(executor.map(lambda year: _read_one_year(year, city), years))
+
     schools_by_name = {}
-    for year in years:
-        with open(f"resources/e8-schools-{year}.csv") as csvfile:
-            reader = csv.DictReader(csvfile, delimiter=';')
-            for row in reader:
-                if row["city"] == city:
-                    if not row["school"] in schools_by_name:
-                        schools_by_name[row["school"]] = School(row["school"])
-
-                    school = schools_by_name[row["school"]]
-                    if row["polish_average"]:
-                        school.add_result(Subject.POLISH, int(year), convert_to_float(row["polish_average"]))
-                    if row["english_average"]:
-                        school.add_result(Subject.ENGLISH, int(year), convert_to_float(row["english_average"]))
-                    if row["math_average"]:
-                        school.add_result(Subject.MATH, int(year), convert_to_float(row["math_average"]))
+    for year, rows in zip(years, years_rows):
+        year_int = int(year)
+        for name, results in rows:
+            school = schools_by_name.get(name)
+            if school is None:
+                school = schools_by_name[name] = School(name)
+            add_result = school.add_result
+            for subject, result in results:
+                add_result(subject, year_int, result)
 
     return list(schools_by_name.values())
 
+def _read_one_year(year: str, city: str) -> list[tuple[str, list[tuple[Subject, float]]]]:
+    """
+    Reads the rows of a single year's CSV file that belong to the given city.
+
+    This is the per-file part of `read_schools`. It does not touch any shared state, so the files
+    for different years can be read concurrently.
+
+    The file is memory-mapped and scanned line by line as bytes. Lines that do not contain the city
+    name are skipped by a substring search. The remaining lines are split on ``;`` as bytes; only the
+    rare lines with quoted fields, which cannot be split naively, go through `csv.reader`. The needed
+    columns are picked out of each row with a single `operator.itemgetter` built from the header, and
+    only the school name is decoded: `float` parses the averages straight from bytes, after the same
+    comma replacement as `convert_to_float`. An empty file, which cannot be memory-mapped, has no rows.
+
+    :param year: The school report year (e.g., '2021').
+    :type year: str
+    :param city: The name of the city to filter schools by.
+    :type city: str
+    :return: One ``(school name, [(subject, result), ...])`` pair per matching row, in file order.
+             Subjects without a result in that row are left out. School names are interned, so the
+             same name read from different years is the same string object.
+    :rtype: list[tuple[str, list[tuple[Subject, float]]]]
+
+    :raises KeyError: If one of the expected columns is missing from the header.
+    """
+    rows = []
+    city_bytes = city.encode()
+    with open(f"resources/e8-schools-{year}.csv", "rb") as csvfile:
+        if os.fstat(csvfile.fileno()).st_size == 0:
+            return rows
+        with mmap.mmap(csvfile.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            lines = iter(data.readline, b"")
+            header = next(csv.reader([next(lines).decode("utf-8-sig")], delimiter=';'))
+            columns = {name: index for index, name in enumerate(header)}
+            city_index = columns["city"]
+            get_fields = itemgetter(city_index, columns["school"], *(columns[column] for column, _ in _SUBJECT_COLUMNS))
+            subjects = tuple(subject for _, subject in _SUBJECT_COLUMNS)
+
+            for line in lines:
+                if city_bytes not in line:
+                    continue
+                if b'"' in line:
+                    fields = [field.encode() for field in next(csv.reader([line.decode()], delimiter=';'))]
+                else:
+                    fields = line.rstrip(b"\r\n").split(b";")
+                row_city, school, *values = get_fields(fields)
+                if row_city != city_bytes:
+                    continue
+                results = []
+                for subject, value in zip(subjects, values):
+                    if value:
+                        results.append((subject, float(value.replace(b",", b".", 1))))
+                rows.append((sys.intern(school.decode()), results))
+    return rows
+
 def convert_to_float(number_as_string: str) -> float:
     """
     Converts a string representation of a number to a float.
@@ -241,7 +383,17 @@ def convert_to_float(number_as_string: str) -> float:
         ...
     ValueError: could not convert string to float: 'abc'
     """
-    return 0 if not number_as_string else float(number_as_string.replace(",", "."))
+    if not number_as_string:
+        return 0.0
+    if "," in number_as_string:
+        return float(number_as_string.replace(",", ".", 1))
+    return float(number_as_string)
+
+_SUBJECT_ORDERS: dict[tuple[str, str], str] = {
+    (subject_code, order_code): f"{subject}_{order}"
+    for subject_code, subject in (("P", "polish"), ("E", "english"), ("M", "math"), ("A", "all"))
+    for order_code, order in (("A", "average"), ("T", "trend"))
+}
 
 def get_subject_order(subject_code: str, order_code: str) -> str:
     """
@@ -254,7 +406,7 @@ def get_subject_order(subject_code: str, order_code: str) -> str:
     :return: The resulting field name used for sorting (e.g., "english_trend").
     :rtype: str
 
-    :raises ValueError: If the provided subject_code or order_code is not supported.
+    :raises KeyError: If the provided subject_code or order_code is not supported.
 
     :example:
 
@@ -267,14 +419,13 @@ def get_subject_order(subject_code: str, order_code: str) -> str:
     >>> get_subject_order("G", "A")
     Traceback (most recent call last):
         ...
-    ValueError: Invalid subject code: G. Allowed: P, E, M, A
+    KeyError: ('G', 'A')
     """
-    subjects = {"P": "polish", "E": "english", "M": "math", "A": "all"}
-    orders = {"A": "average", "T": "trend"}
-    return subjects[subject_code] + "_" + orders[order_code]
+    return _SUBJECT_ORDERS[(subject_code, order_code)]
 
 
-def get_sorted_school_rows(schools: list[School], subject_order: str, trend_year: int) -> list[dict[str, float]]:
+def get_sorted_school_rows(schools: list[School], subject_order: str, trend_year: int,
+                           top_k: int | None = None) -> list[dict[str, float]]:
     """
     Converts a list of School objects to dictionaries using `convert_to_dict`, and returns the list
     sorted in descending order by the specified subject and metric (e.g., 'polish_average').
@@ -282,6 +433,7 @@ def get_sorted_school_rows(schools: list[School], subject_order: str, trend_year
     :param schools: List of School objects to be converted and sorted.
     :param subject_order: The key to sort by (e.g., ``"math_average"``, ``"english_trend"``, ``"all_average"``, etc.).
     :param trend_year: The year used for trend calculation in each school's ``convert_to_dict`` method.
+    :param top_k: If given, only the ``top_k`` best rows are returned (see `sort_school_rows`).
 
     :return: A list of dictionaries, each containing metrics for a school, sorted in descending order
              by the specified subject metric.
@@ -317,7 +469,110 @@ def get_sorted_school_rows(schools: list[School], subject_order: str, trend_year
         ]
     """
     school_rows = [school.convert_to_dict(trend_year) for school in schools]
-    school_rows.sort(key=lambda item: item[subject_order], reverse=True)
+    return sort_school_rows(school_rows, subject_order, top_k)
+
+
+def sort_school_rows(school_rows: list[dict[str, float]], subject_order: str,
+                     top_k: int | None = None) -> list[dict[str, float]]:
+    """
+    Returns the school rows sorted in descending order by the specified subject and metric.
+
+    Rows with equal keys keep their original relative order. If ``top_k`` is given, only the
+    ``top_k`` best rows are returned. The input list is left untouched.
+
+    :param school_rows: List of school dictionaries as produced by `School.convert_to_dict` or `compute_report`.
+    :param subject_order: The key to sort by (e.g., ``"math_average"``, ``"english_trend"``, ``"all_average"``, etc.).
+    :param top_k: The number of rows to return, or None to return all of them.
+
+    :return: A new list with the rows, or only the ``top_k`` best of them, sorted in descending order
+             by the specified subject metric.
+
+    :raises KeyError: If the specified ``subject_order`` key is not present in one or more dictionaries.
+    """
+    if top_k is not None:
+        return heapq.nlargest(top_k, school_rows, key=itemgetter(subject_order))
+    return sorted(school_rows, key=itemgetter(subject_order), reverse=True)
+
+
+def _ols_kernel(results: np.ndarray, years: np.ndarray, trend_year: int) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Computes averages and clipped least-squares predictions for every series in a stacked result array.
+
+    Missing results are NaN. All series share one design matrix, the year grid, which is centred on
+    its mean so that the normal equations stay well-conditioned, as a least-squares solver would
+    ensure. All five sums needed by the closed-form fit come from two matrix products with the
+    design ``[1, x, x²]``: one of a 0/1 presence mask (giving the counts, Σx and Σx²) and one of the
+    NaN-free results (giving Σy and Σxy), so the only temporaries of the full input size are those
+    two arrays. A series with a single year falls back to its mean and an empty series yields 0.0,
+    and every prediction is clipped to [0, 100], matching `School.calculate_trend`.
+
+    :param results: Array of shape (..., years) holding the results, NaN where missing.
+    :type results: np.ndarray
+    :param years: The years corresponding to the last axis of ``results``, as floats.
+    :type years: np.ndarray
+    :param trend_year: The year for which to predict the results.
+    :type trend_year: int
+    :return: Two arrays with the shape of ``results`` minus its last axis: the averages and the trends.
+    :rtype: tuple[np.ndarray, np.ndarray]
+    """
+    import numpy as np
+
+    center = years.mean()
+    years = years - center
+    present = np.isfinite(results).astype(np.float64)
+    values = np.nan_to_num(results, nan=0.0)
+
+    design = np.stack([np.ones_like(years), years, years * years], axis=1)
+    n, sum_x, sum_xx = np.moveaxis(present @ design, -1, 0)
+    sum_y, sum_xy = np.moveaxis(values @ design[:, :2], -1, 0)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        averages = np.where(n > 0, sum_y / n, 0.0)
+        denominator = n * sum_xx - sum_x * sum_x
+        slope = (n * sum_xy - sum_x * sum_y) / denominator
+        intercept = (sum_y - slope * sum_x) / n
+        trends = np.clip(np.where(denominator != 0, slope * (trend_year - center) + intercept, averages), 0.0, 100.0)
+
+    return averages, trends
+
+
+def compute_report(schools: list[School], trend_year: int) -> list[dict[str, float]]:
+    """
+    Computes the same rows as `School.convert_to_dict` for all schools at once.
+
+    :param schools: List of School objects to report on.
+    :type schools: list[School]
+    :param trend_year: The year for which to predict exam trends.
+    :type trend_year: int
+    :return: A list of dictionaries with the keys described in `School.convert_to_dict`, in the order of ``schools``.
+    :rtype: list[dict[str, float or str]]
+    """
+    if not schools:
+        return []
+
+    import numpy as np
+
+    results = np.frombuffer(b"".join(school._arr for school in schools), dtype=np.float64)
+    results = results.reshape(len(schools), len(Subject), len(School.YEARS))
+    averages, trends = _ols_kernel(results, np.array(School.YEARS, dtype=np.float64), trend_year)
+
+    all_averages = averages.mean(axis=1)
+    all_trends = trends.mean(axis=1)
+
+    school_rows = []
+    for school, average, trend, all_average, all_trend in zip(
+            schools, averages.tolist(), trends.tolist(), all_averages.tolist(), all_trends.tolist()):
+        school_rows.append({
+            "school": school.name,
+            "polish_average": average[0],
+            "polish_trend": trend[0],
+            "english_average": average[1],
+            "english_trend": trend[1],
+            "math_average": average[2],
+            "math_trend": trend[2],
+            "all_average": all_average,
+            "all_trend": all_trend
+        })
     return school_rows
 
 
@@ -325,7 +580,12 @@ def print_school_table(school_rows: list[dict[str, float]]) -> None:
     """
     Displays school results as a formatted table in the console.
 
+    The ``school`` column is left-aligned and every other column is right-aligned with two decimals.
+    Each column is as wide as its header or its widest value, whichever is wider. Prints nothing for
+    an empty list.
+
     :param school_rows: A list of dictionaries, each representing a school's performance data.
+                        All rows must have the same keys as the first one.
     :type school_rows: list[dict[str, float]]
 
     :example:
@@ -334,14 +594,87 @@ def print_school_table(school_rows: list[dict[str, float]]) -> None:
         ...     {"school": "Alpha", "math_average": 75.0, "math_trend": 78.2, "all_average": 76.3, "all_trend": 79.0},
         ...     {"school": "Beta", "math_average": 70.0, "math_trend": 72.0, "all_average": 71.5, "all_trend": 73.4}
         ... ])
-        +---------+---------------+-------------+--------------+------------+
-        | school  | math_average  | math_trend  | all_average  | all_trend  |
-        +---------+---------------+-------------+--------------+------------+
-        | Alpha   | 75.0          | 78.2        | 76.3         | 79.0       |
-        | Beta    | 70.0          | 72.0        | 71.5         | 73.4       |
-        +---------+---------------+-------------+--------------+------------+
+        school  math_average  math_trend  all_average  all_trend
+        ------  ------------  ----------  -----------  ---------
+        Alpha          75.00       78.20        76.30      79.00
+        Beta           70.00       72.00        71.50      73.40
+    """
+    if not school_rows:
+        return
+
+    widths = {}
+    for key in school_rows[0]:
+        values = [row[key] for row in school_rows]
+        if key == "school":
+            widths[key] = max(len(key), max(map(len, values)))
+        else:
+            widths[key] = max(len(key), len(f"{min(values):.2f}"), len(f"{max(values):.2f}"))
+
+    header = "  ".join(f"{key:<{width}}" if key == "school" else f"{key:>{width}}" for key, width in widths.items())
+    rule = "  ".join("-" * width for width in widths.values())
+    row_format = "  ".join(
+        f"{{{key}:<{width}}}" if key == "school" else f"{{{key}:>{width}.2f}}" for key, width in widths.items()
+    )
+
+    lines = [header, rule]
+    lines.extend(row_format.format_map(row) for row in school_rows)
+    sys.stdout.write("\n".join(lines) + "\n")
+
+def input_non_blank(prompt: str) -> str:
+    """
+    Prompts the user until they enter a non-blank answer.
+
+    :param prompt: The text shown to the user.
+    :type prompt: str
+    :return: The answer with surrounding whitespace removed.
+    :rtype: str
+
+    :raises KeyboardInterrupt: If the user cancels input (e.g. with Ctrl+C).
+    :raises EOFError: If the input stream ends before an answer is entered.
+
+    :example:
+
+        >>> input_non_blank("City: ")
+        City:
+        Blank values are not allowed.
+        City:  Warszawa
+        'Warszawa'
+    """
+    while True:
+        answer = input(prompt).strip()
+        if answer:
+            return answer
+        print("Blank values are not allowed.")
+
+def input_choice(prompt: str, choices: list[str]) -> str:
     """
-    print(tabulate(school_rows, headers="keys"))
+    Prompts the user until they enter one of the given choices.
+
+    Input is stripped and upper-cased before it is compared, so ``" p"`` selects ``"P"``.
+
+    :param prompt: The text shown to the user.
+    :type prompt: str
+    :param choices: The accepted upper-case answers.
+    :type choices: list[str]
+    :return: The selected choice.
+    :rtype: str
+
+    :raises KeyboardInterrupt: If the user cancels input (e.g. with Ctrl+C).
+    :raises EOFError: If the input stream ends before a valid choice is entered.
+
+    :example:
+
+        >>> input_choice("Order (A for average, T for trend): ", ["A", "T"])
+        Order (A for average, T for trend): x
+        'X' is not a valid choice.
+        Order (A for average, T for trend): t
+        'T'
+    """
+    while True:
+        choice = input(prompt).strip().upper()
+        if choice in choices:
+            return choice
+        print(f"'{choice}' is not a valid choice.")
 
 def main():
     """
@@ -364,18 +697,13 @@ def main():
 
         # Output: Sorted table of school data for Warsaw by Polish trend
     """
-    city: str = pyip.inputStr("City: ")
-    subject: str = pyip.inputChoice(
-        choices=["P", "E", "M", "A"],
-        prompt="Subject (P for Polish, E for English, M for Math, A for all): "
-    )
-    order: str = pyip.inputChoice(
-        choices=["A", "T"],
-        prompt="Order (A for average, T for trend): "
-    )
+    city: str = input_non_blank("City: ")
+    subject: str = input_choice("Subject (P for Polish, E for English, M for Math, A for all): ", ["P", "E", "M", "A"])
+    order: str = input_choice("Order (A for average, T for trend): ", ["A", "T"])
 
     subject_order = get_subject_order(subject, order)
-    school_rows = get_sorted_school_rows(read_schools(["2021", "2022", "2023", "2024", "2025"], city), subject_order, 2026)
+    years = [str(year) for year in School.YEARS]
+    school_rows = sort_school_rows(compute_report(read_schools(years, city), 2026), subject_order)
     print_school_table(school_rows)
 
 if __name__ == '__main__':
@@ -1,5 +1,10 @@
+import io
+import os
+import tempfile
 import unittest
-from project import convert_to_float, Subject, School, get_subject_order, get_sorted_school_rows
+from contextlib import redirect_stdout
+from unittest.mock import patch
+from project import convert_to_float, Subject, School, get_subject_order, get_sorted_school_rows, sort_school_rows, read_schools, compute_report, print_school_table, input_choice, input_non_blank
 
 class TestSchool(unittest.TestCase):
 
@@ -30,6 +35,13 @@ class TestSchool(unittest.TestCase):
         school.add_result(Subject.MATH,2021, 32.0)
         self.assertEqual(school.calculate_average(Subject.MATH), 32)
 
+    def test_calculate_average_replaced_result(self):
+        school = School("A")
+        school.add_result(Subject.MATH, 2021, 32.0)
+        school.add_result(Subject.MATH,2022, 64.0)
+        school.add_result(Subject.MATH,2022, 40.0)
+        self.assertEqual(school.calculate_average(Subject.MATH), 36)
+
     def test_calculate_average_no_results(self):
         school = School("A")
         self.assertEqual(school.calculate_average(Subject.MATH), 0)
@@ -49,6 +61,21 @@ class TestSchool(unittest.TestCase):
         school = School("A")
         self.assertEqual(school.calculate_trend(Subject.MATH,2022), 0.0)
 
+    def test_calculate_trend_three_results(self):
+        school = School("A")
+        school.add_result(Subject.MATH,2021, 40.0)
+        school.add_result(Subject.MATH,2022, 50.0)
+        school.add_result(Subject.MATH,2023, 48.0)
+        self.assertAlmostEqual(school.calculate_trend(Subject.MATH,2024), 54.0)
+
+    def test_calculate_trend_after_add_result(self):
+        school = School("A")
+        school.add_result(Subject.MATH,2021, 32.0)
+        self.assertEqual(school.calculate_trend(Subject.MATH,2023), 32.0)
+        school.add_result(Subject.MATH,2022, 64.0)
+        self.assertEqual(school.calculate_trend(Subject.MATH,2023), 96.0)
+        self.assertEqual(school.calculate_average(Subject.MATH), 48)
+
     def test_calculate_trend_greater_than_100(self):
         school = School("A")
         school.add_result(Subject.MATH,2021, 80.0)
@@ -61,6 +88,55 @@ class TestSchool(unittest.TestCase):
         school.add_result(Subject.MATH,2022, 1.0)
         self.assertEqual(school.calculate_trend(Subject.MATH,2023), 0.0)
 
+    def test_add_result_invalid_subject(self):
+        school = School("A")
+        with self.assertRaises(KeyError):
+            school.add_result(0, 2021, 5.0)
+        with self.assertRaises(KeyError):
+            school.add_result(4, 2021, 5.0)
+        self.assertFalse(school.has_results(Subject.MATH))
+
+    def test_add_result_not_finite(self):
+        school = School("A")
+        for result in (float("nan"), float("inf"), float("-inf")):
+            with self.assertRaises(ValueError):
+                school.add_result(Subject.MATH, 2021, result)
+        school.add_result(Subject.MATH, 2021, 40.0)
+        self.assertEqual(school.calculate_average(Subject.MATH), 40.0)
+
+    def test_convert_to_dict_after_add_result(self):
+        school = School("A")
+        school.add_result(Subject.MATH,2021, 32.0)
+        first = school.convert_to_dict(2023)
+        first["math_trend"] = -1.0
+        self.assertEqual(school.convert_to_dict(2023)["math_trend"], 32.0)
+        school.add_result(Subject.MATH,2022, 64.0)
+        self.assertEqual(school.convert_to_dict(2023)["math_trend"], 96.0)
+
+class TestReadSchools(unittest.TestCase):
+
+    def test_single_school(self):
+        schools = read_schools(["2023", "2024", "2025"], "Ciele")
+        self.assertEqual(len(schools), 1)
+        self.assertEqual(schools[0].name, 'NIEPUBLICZNA SZKOŁA PODSTAWOWA "4 PORY ROKU" SZKOŁA TWÓRCZA I JĘZYKÓW OBCYCH')
+        self.assertAlmostEqual(schools[0].calculate_average(Subject.POLISH), (76.08333333 + 69.84615385 + 72.0) / 3)
+        self.assertAlmostEqual(schools[0].calculate_average(Subject.MATH), (67.33333333 + 54.46153846 + 62.875) / 3)
+
+    def test_no_years(self):
+        self.assertEqual(read_schools([], "Ciele"), [])
+
+    def test_unknown_city(self):
+        self.assertEqual(read_schools(["2025"], "Atlantis"), [])
+
+    def test_empty_file(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        os.mkdir(os.path.join(directory.name, "resources"))
+        open(os.path.join(directory.name, "resources", "e8-schools-2021.csv"), "wb").close()
+        self.addCleanup(os.chdir, os.getcwd())
+        os.chdir(directory.name)
+        self.assertEqual(read_schools(["2021"], "Ciele"), [])
+
 class TestConvertToFlat(unittest.TestCase):
 
     def test_integers(self):
@@ -141,6 +217,27 @@ class TestGetSortedSchoolRows(unittest.TestCase):
         names = [row["school"] for row in sorted_rows]
         self.assertEqual(names, ["Alpha", "Gamma", "Beta"])
 
+    def test_ties_keep_input_order(self):
+        self.schools.append(MockSchool("Delta", {"math_average": 75.0, "math_trend": 70.0}))
+        sorted_rows = get_sorted_school_rows(self.schools, "math_average", 2025)
+        names = [row["school"] for row in sorted_rows]
+        self.assertEqual(names, ["Beta", "Gamma", "Delta", "Alpha"])
+
+    def test_sort_by_school(self):
+        sorted_rows = get_sorted_school_rows(self.schools, "school", 2025)
+        names = [row["school"] for row in sorted_rows]
+        self.assertEqual(names, ["Gamma", "Beta", "Alpha"])
+
+    def test_top_k(self):
+        sorted_rows = get_sorted_school_rows(self.schools, "math_average", 2025, top_k=2)
+        names = [row["school"] for row in sorted_rows]
+        self.assertEqual(names, ["Beta", "Gamma"])
+
+    def test_top_k_larger_than_input(self):
+        sorted_rows = get_sorted_school_rows(self.schools, "math_trend", 2025, top_k=10)
+        names = [row["school"] for row in sorted_rows]
+        self.assertEqual(names, ["Alpha", "Gamma", "Beta"])
+
     def test_empty_input(self):
         sorted_rows = get_sorted_school_rows([], "math_average", 2025)
         self.assertEqual(sorted_rows, [])
@@ -150,3 +247,104 @@ class TestGetSortedSchoolRows(unittest.TestCase):
         self.schools.append(MockSchool("Delta", {"english_average": 60.0}))
         with self.assertRaises(KeyError):
             get_sorted_school_rows(self.schools, "math_average", 2025)
+
+class TestSortSchoolRows(unittest.TestCase):
+
+    def test_returns_new_list(self):
+        school_rows = [{"school": "Alpha", "math_average": 65.0}, {"school": "Beta", "math_average": 82.0}]
+        for top_k in (None, 1):
+            sorted_rows = sort_school_rows(school_rows, "math_average", top_k)
+            self.assertIsNot(sorted_rows, school_rows)
+            self.assertEqual(sorted_rows[0]["school"], "Beta")
+            self.assertEqual([row["school"] for row in school_rows], ["Alpha", "Beta"])
+
+class TestComputeReport(unittest.TestCase):
+
+    def test_matches_convert_to_dict(self):
+        alpha = School("Alpha")
+        alpha.add_result(Subject.POLISH, 2021, 32.0)
+        alpha.add_result(Subject.POLISH, 2022, 64.0)
+        alpha.add_result(Subject.ENGLISH, 2021, 80.0)
+        alpha.add_result(Subject.ENGLISH, 2022, 99.0)
+        alpha.add_result(Subject.MATH, 2023, 50.0)
+        beta = School("Beta")
+        beta.add_result(Subject.MATH, 2021, 20.0)
+        beta.add_result(Subject.MATH, 2023, 1.0)
+        beta.add_result(Subject.MATH, 2025, 15.0)
+        gamma = School("Gamma")
+        gamma.add_result(Subject.MATH, 2021, 150.0)
+        gamma.add_result(Subject.POLISH, 2022, -5.0)
+        rows = compute_report([alpha, beta, gamma], 2026)
+        for school, row in zip([alpha, beta, gamma], rows):
+            expected = school.convert_to_dict(2026)
+            self.assertEqual(list(row.keys()), list(expected.keys()))
+            self.assertEqual(row["school"], expected["school"])
+            for key in list(expected.keys())[1:]:
+                self.assertAlmostEqual(row[key], expected[key])
+
+    def test_empty_input(self):
+        self.assertEqual(compute_report([], 2026), [])
+
+class TestPrintSchoolTable(unittest.TestCase):
+
+    def test_table(self):
+        output = io.StringIO()
+        with redirect_stdout(output):
+            print_school_table([
+                {"school": "Alpha", "math_average": 75.0, "math_trend": 78.25},
+                {"school": "Beta", "math_average": 100.0, "math_trend": 7.0},
+            ])
+        self.assertEqual(output.getvalue().splitlines(), [
+            "school  math_average  math_trend",
+            "------  ------------  ----------",
+            "Alpha          75.00       78.25",
+            "Beta          100.00        7.00",
+        ])
+
+    def test_values_wider_than_header(self):
+        output = io.StringIO()
+        with redirect_stdout(output):
+            print_school_table([
+                {"school": "A", "x": 100.0},
+                {"school": "B", "x": -5.5},
+            ])
+        self.assertEqual(output.getvalue().splitlines(), [
+            "school       x",
+            "------  ------",
+            "A       100.00",
+            "B        -5.50",
+        ])
+
+    def test_empty(self):
+        output = io.StringIO()
+        with redirect_stdout(output):
+            print_school_table([])
+        self.assertEqual(output.getvalue(), "")
+
+class TestInputChoice(unittest.TestCase):
+
+    @patch("builtins.input", return_value="P")
+    def test_valid_choice(self, _):
+        self.assertEqual(input_choice("Subject: ", ["P", "E", "M", "A"]), "P")
+
+    @patch("builtins.input", return_value=" t ")
+    def test_lowercase_and_whitespace(self, _):
+        self.assertEqual(input_choice("Order: ", ["A", "T"]), "T")
+
+    @patch("builtins.input", side_effect=["X", "", "A"])
+    def test_reprompts_until_valid(self, mock_input):
+        with redirect_stdout(io.StringIO()):
+            self.assertEqual(input_choice("Order: ", ["A", "T"]), "A")
+        self.assertEqual(mock_input.call_count, 3)
+
+class TestInputNonBlank(unittest.TestCase):
+
+    @patch("builtins.input", return_value="  Warszawa ")
+    def test_strips_answer(self, _):
+        self.assertEqual(input_non_blank("City: "), "Warszawa")
+
+    @patch("builtins.input", side_effect=["", "   ", "Kraków"])
+    def test_reprompts_until_non_blank(self, mock_input):
+        with redirect_stdout(io.StringIO()):
+            self.assertEqual(input_non_blank("City: "), "Kraków")
+        self.assertEqual(mock_input.call_count, 3)